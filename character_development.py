@@ -1,6 +1,6 @@
-import re
+import io
 from collections import defaultdict
-from scene_validator import is_action, is_dialogue, is_scene_heading, is_character_name
+from scene_validator import classify_script, SCENE, CHAR, BLANK, DIALOGUE_TYPES, ACTION_TYPES
 
 """
 Character Development Validator Module
@@ -16,70 +16,106 @@ Dependencies:
 """
 
 
-def character_development_validator(script):
+def _is_word_char(c):
+    return c.isalnum() or c == '_'
+
+
+def _find_caps_names(line):
+    """
+    Find ALL CAPS runs in an action line that look like character names.
+
+    Single-pass scanner equivalent to re.findall(r'\b[A-Z][A-Z ]{1,39}\b')
+    with each match stripped: a run starts on a capital letter at a word
+    boundary, spans at most 40 capitals/spaces and is trimmed back until it
+    ends on a word boundary.
+    """
+    names = []
+    n = len(line)
+    i = 0
+    while i < n:
+        c = line[i]
+        if 'A' <= c <= 'Z' and (i == 0 or not _is_word_char(line[i - 1])):
+            end = i + 1
+            limit = min(n, i + 40)
+            while end < limit and (line[end] == ' ' or 'A' <= line[end] <= 'Z'):
+                end += 1
+            # Back off until the run ends on a word boundary
+            while end >= i + 2:
+                if line[end - 1] == ' ':
+                    if end < n and _is_word_char(line[end]):
+                        break
+                elif end == n or not _is_word_char(line[end]):
+                    break
+                end -= 1
+            if end >= i + 2:
+                names.append(line[i:end].strip())
+                i = end
+                continue
+        i += 1
+    return names
+
+
+def character_development_validator(script, classified=None):
     """
     Analyze character development across the script.
     Flags characters introduced but not speaking, or speaking too little.
+    Accepts the output of classify_script to skip re-classifying the lines.
     """
-    lines = script.strip().split('\n')
+    tokens, _ = classified if classified is not None else classify_script(script)
     character_speakers = defaultdict(int)  # Track how many lines each character spoke
     introduced = {}  # Track first appearance (via action or dialogue)
     current_character = None
     scenes = 0
     scene_map = defaultdict(set)  # Track which scenes a character appears in
 
-    for i, line in enumerate(lines):
-        line = line.strip()
-
-        if is_scene_heading(line):
+    for i, (line_type, line) in enumerate(tokens):
+        if line_type == SCENE:
             scenes += 1
             continue
 
         # Track character name before dialogue
-        if is_character_name(line):
+        if line_type == CHAR:
             current_character = line.strip()
-            if current_character not in introduced:
-                introduced[current_character] = i + 1
+            introduced.setdefault(current_character, i + 1)
 
-        elif is_dialogue(line) and current_character:
+        elif line_type in DIALOGUE_TYPES and current_character:
             character_speakers[current_character] += 1
             scene_map[current_character].add(scenes)
 
-        elif is_action(line):
+        elif line_type in ACTION_TYPES:
             # Find all ALL CAPS words that look like names
-            possible_names = re.findall(r'\b[A-Z][A-Z ]{1,39}\b', line)
-            for name in possible_names:
-                name = name.strip()
-                if name not in introduced:
-                    introduced[name] = i + 1
+            for name in _find_caps_names(line.strip()):
+                introduced.setdefault(name, i + 1)
 
         # Reset speaker context on blank line
-        elif not line:
+        elif line_type == BLANK:
             current_character = None
 
     # Build report
-    report = ["\nCharacter Development Report", "--------------------------------", ""]
-    report.append("Introduced Characters:")
+    buf = io.StringIO()
+    w = buf.write
+    w("\nCharacter Development Report\n--------------------------------\n\n")
+    w("Introduced Characters:\n")
+    warnings = []  # Collected in the same sweep, in introduction order
     for char, line_no in introduced.items():
         intro = f"{char} (Line {line_no})"
         if char not in character_speakers:
-            report.append(f"    - {intro}: Introduced via action only ❌")
+            w(f"    - {intro}: Introduced via action only ❌\n")
+            warnings.append(f"{char}: ❌ Never speaks\n")
         else:
-            report.append(f"    - {intro}: Introduced via dialogue only ⚠️")
+            w(f"    - {intro}: Introduced via dialogue only ⚠️\n")
 
-    report.append("\nSpeaking Presence:")
+    w("\nSpeaking Presence:\n")
     for char, count in character_speakers.items():
         scene_count = len(scene_map[char])
         if count == 1:
-            report.append(f"{char}: ⚠️ Only speaks once")
+            w(f"{char}: ⚠️ Only speaks once\n")
         else:
-            report.append(f"{char}: Speaks {count} times across {scene_count} scenes")
+            w(f"{char}: Speaks {count} times across {scene_count} scenes\n")
 
     # Final warnings
-    report.append("\nWarnings:")
-    for char in introduced:
-        if char not in character_speakers:
-            report.append(f"{char}: ❌ Never speaks")
+    w("\nWarnings:\n")
+    w("".join(warnings))
 
-    return '\n'.join(report)
+    return buf.getvalue()[:-1]  # no newline after the last report line
 
@@ -5,7 +5,7 @@ from datetime import datetime
 from text_to_script import line_write, format_script
 from character_development import character_development_validator
 from media_readability import readability_analysis
-from scene_validator import scene_structure_validator, character_tracking
+from scene_validator import classify_script, scene_structure_validator, character_tracking
 from pacing_and_distribution import scene_pacing_and_distribution
 from speaking_time import character_speaking_stats
 
@@ -14,6 +14,9 @@ class ScriptAnalyzerCLI:
         self.script = ""
         self.reports = {}
         self.current_edit = None
+        self._cached_reports = None  # Reports dict the cached values below were built from
+        self._report_keys = []
+        self._full_report = ""
 
     def extract_title(self, script: str) -> str:
         for line in script.splitlines():
@@ -21,6 +24,17 @@ class ScriptAnalyzerCLI:
                 return line.strip()
         return "Untitled Script"
 
+    def _cache_reports(self):
+        """Cache the report order and the combined report for self.reports.
+
+        Rebuilt only when self.reports has been replaced, so viewing and
+        saving reuse the same key list and full report text.
+        """
+        if self._cached_reports is not self.reports:
+            self._report_keys = list(self.reports.keys())
+            self._full_report = "\n\n".join(f"{k}:\n{v}" for k, v in self.reports.items())
+            self._cached_reports = self.reports
+
     def show_menu(self):
         print("\n" + "="*50)
         print("SCRIPT ANALYZER CLI TOOL")
@@ -39,8 +53,7 @@ class ScriptAnalyzerCLI:
         filepath = input("Enter file path: ").strip()
         try:
             with open(filepath, 'r', encoding='utf-8') as file:
-                raw_text = file.read()
-                self.script = format_script(raw_text)
+                self.script = format_script(file)  # Stream lines instead of reading the whole file
                 print(f"\nLoaded script from {filepath}")
         except Exception as e:
             print(f"Error loading file: {e}")
@@ -100,17 +113,19 @@ class ScriptAnalyzerCLI:
         print("\nRunning analysis...")
         title = self.extract_title(self.script)
         current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        classified = classify_script(self.script)  # Classify lines once for every analyzer
         
         # Run all analysis functions from imported modules
         self.reports = {
             "Title & Date": title+"\n"+current_time,  # Script metadata
-            "Structure": scene_structure_validator(self.script),  # From scene_validator.py
-            "Characters": character_tracking(self.script),  # From scene_validator.py
-            "Development": character_development_validator(self.script),  # From character_development.py
-            "Pacing": scene_pacing_and_distribution(self.script),  # From pacing_and_distribution.py
-            "Readability": readability_analysis(self.script),  # From media_readability.py
-            "Speaking": character_speaking_stats(self.script)  # From speaking_time.py
+            "Structure": scene_structure_validator(self.script, classified),  # From scene_validator.py
+            "Characters": character_tracking(self.script, classified),  # From scene_validator.py
+            "Development": character_development_validator(self.script, classified),  # From character_development.py
+            "Pacing": scene_pacing_and_distribution(self.script, classified),  # From pacing_and_distribution.py
+            "Readability": readability_analysis(self.script, classified),  # From media_readability.py
+            "Speaking": character_speaking_stats(self.script, classified)  # From speaking_time.py
         }
+        self._cache_reports()
         print("Analysis complete")
 
     def view_reports(self):
@@ -124,31 +139,31 @@ class ScriptAnalyzerCLI:
             print("No reports available. Please run analysis first.")
             return
 
+        self._cache_reports()
         print("\n" + "="*50)
         print("REPORTS MENU")
         print("="*50)
         # List all available report sections
-        for i, (name, _) in enumerate(self.reports.items(), 1):
+        for i, name in enumerate(self._report_keys, 1):
             print(f"{i}. View {name} report")
-        print(f"{len(self.reports.items())+1}. View Full report")
+        print(f"{len(self._report_keys)+1}. View Full report")
         print("0. Back to main menu")
         print("="*50)
 
         choice = input("Select report to view: ")
         if choice.isdigit():
             choice = int(choice)
-            if 1 <= choice <= len(self.reports):
+            if 1 <= choice <= len(self._report_keys):
                 # Show individual report
-                report_name = list(self.reports.keys())[choice-1]
+                report_name = self._report_keys[choice-1]
                 print(f"\n{report_name} Report:")
                 print("="*50)
                 print(self.reports[report_name])
-            elif choice == len(self.reports)+1:
+            elif choice == len(self._report_keys)+1:
                 # Show combined report
                 print(f"\nFull Report:")
                 print("="*50)
-                full_report = "\n\n".join(f"{k}:\n{v}" for k, v in self.reports.items())
-                print(full_report)        
+                print(self._full_report)
             elif choice == 0:
                 return  # Return to main menu
 
@@ -158,11 +173,11 @@ class ScriptAnalyzerCLI:
             return
 
         filename = input("Enter filename to save report: ").strip()
-        full_report = "\n\n".join(f"{k}:\n{v}" for k, v in self.reports.items())
+        self._cache_reports()
         
         try:
             with open(filename, 'w', encoding='utf-8') as file:
-                file.write(full_report)
+                file.write(self._full_report)
             print(f"Report saved to {filename}")
         except Exception as e:
             print(f"Error saving file: {e}")
@@ -1,5 +1,6 @@
+import io
 from collections import defaultdict
-from scene_validator import is_dialogue, is_scene_heading, is_character_name
+from scene_validator import classify_script, BLANK, SCENE, CHAR
 
 """
 Media Readability Analyzer
@@ -19,12 +20,14 @@ Dependencies:
 - scene_validator: For element type detection functions
 """
 
-def readability_analysis(script):
+def readability_analysis(script, classified=None):
     """
     Perform format-specific readability analysis on a screenplay.
     
     Args:
         script (str): Complete screenplay text to analyze
+        classified (tuple, optional): Output of classify_script(script), to
+            reuse a classification shared with other analyzers
         
     Returns:
         str: Comprehensive readability report with:
@@ -39,26 +42,19 @@ def readability_analysis(script):
         - Long line readability concerns
         - Format-specific optimization opportunities
     """
-    lines = script.strip().split("\n")
+    tokens, scene_starts = classified if classified is not None else classify_script(script)
     scenes = []
-    current_scene = {"heading": None, "content": []}
     scene_counter = 0
 
     # Split the script into scenes
-    for line in lines:
-        if is_scene_heading(line):
-            if current_scene["heading"]:
-                scenes.append(current_scene)
-            scene_counter += 1
-            current_scene = {
-                "heading": line.strip(),
-                "content": [],
-                "index": scene_counter,
-            }
-        else:
-            current_scene["content"].append(line)
-    if current_scene["heading"]:
-        scenes.append(current_scene)
+    scene_ends = scene_starts[1:] + [len(tokens)]
+    for start, end in zip(scene_starts, scene_ends):
+        scene_counter += 1
+        scenes.append({
+            "heading": tokens[start][1].strip(),
+            "content": tokens[start + 1:end],  # (line_type, line) pairs
+            "index": scene_counter,
+        })
         
     # Scene analysis structure:
     #   - Scene length evaluation for different media formats
@@ -66,7 +62,9 @@ def readability_analysis(script):
     #   - Line length and block detection for readability
     #   - Content structure recommendations
 
-    report = ["\nReadability Analysis", "----------------------"]
+    buf = io.StringIO()
+    w = buf.write
+    w("\nReadability Analysis\n----------------------\n")
     long_lines = 0
     format_flags = {"Web": [], "TV": [], "Stage": []}
 
@@ -75,15 +73,12 @@ def readability_analysis(script):
         long_line_blocks = 0
         consecutive_long = 0
 
-        for line in scene["content"]:
-            if len(line) > 100:
-                long_lines += 1
-                consecutive_long += 1
-            else:
-                consecutive_long = 0
-
-            if consecutive_long >= 5:
-                long_line_blocks += 1
+        # A block is a run of 5+ long lines, counted once when the run reaches 5
+        for _, line in scene["content"]:
+            is_long = len(line) > 100
+            long_lines += is_long
+            consecutive_long = (consecutive_long + 1) if is_long else 0
+            long_line_blocks += consecutive_long == 5
 
         # Web format pacing check
         if scene_len > 15:
@@ -93,8 +88,8 @@ def readability_analysis(script):
 
         # Stage format check (should be mostly dialogue)
         # Temporary simplified dialogue detection
-        dialogue_lines = sum(1 for line in scene["content"] 
-                           if line.strip() and not is_scene_heading(line) and not is_character_name(line))
+        dialogue_lines = sum(1 for line_type, _ in scene["content"]
+                           if line_type not in (BLANK, SCENE, CHAR))
         if dialogue_lines / max(scene_len, 1) < 0.3:
             format_flags["Stage"].append(
                 f"Scene {scene['index']} is action-heavy for stage format ⚠️"
@@ -106,21 +101,21 @@ def readability_analysis(script):
                 f"Scene {scene['index']} has dense narration blocks ⚠️"
             )
 
-    report.append("\nFormat Flags:")
+    w("\nFormat Flags:\n")
     for category, flags in format_flags.items():
         if flags:
             for f in flags:
-                report.append(f"    - {category}: {f}")
+                w(f"    - {category}: {f}\n")
         else:
-            report.append(f"    - {category}: ✔ No issues found")
+            w(f"    - {category}: ✔ No issues found\n")
 
-    report.append("\nGeneral Issues:")
+    w("\nGeneral Issues:\n")
     if long_lines == 0:
-        report.append("    - ✔ No overly long lines found")
+        w("    - ✔ No overly long lines found\n")
     else:
-        report.append(
-            f"    - {long_lines} line(s) exceed 100 characters (may reduce readability)"
+        w(
+            f"    - {long_lines} line(s) exceed 100 characters (may reduce readability)\n"
         )
 
-    return "\n".join(report)
+    return buf.getvalue()[:-1]  # no newline after the last report line
 
@@ -1,5 +1,6 @@
-from collections import defaultdict
-from scene_validator import is_action, is_dialogue, is_scene_heading, is_character_name
+import io
+from collections import Counter
+from scene_validator import classify_script, CHAR, DIALOGUE_TYPES, ACTION_TYPES
 
 """
 Scene Pacing & Distribution Analysis Module
@@ -18,47 +19,59 @@ Dependencies:
 - scene_validator: For line type identification
 """
 
-def scene_pacing_and_distribution(script):
-	lines = script.strip().split('\n')
+def scene_pacing_and_distribution(script, classified=None):
+	tokens, scene_starts = classified if classified is not None else classify_script(script)
 	scenes = []
-	current_scene = {"heading": None, "content": []}
 	scene_counter = 0
 
-	# First split the script into scenes
-	for line in lines:
-		if is_scene_heading(line):
-			if current_scene["heading"]:
-				scenes.append(current_scene)
-			scene_counter += 1
-			current_scene = {"heading": line.strip(), "content": [], "index": scene_counter}
-		else:
-			current_scene["content"].append(line)
-	if current_scene["heading"]:
-		scenes.append(current_scene)
+	# First split the classified lines into scenes
+	scene_ends = scene_starts[1:] + [len(tokens)]
+	for start, end in zip(scene_starts, scene_ends):
+		scene_counter += 1
+		scenes.append({"heading": tokens[start][1].strip(), "content": tokens[start + 1:end], "index": scene_counter})
 
-	# Now analyze each scene
-	scene_reports = []
-	character_lines = defaultdict(int)
+	# Now analyze each scene, keeping the per-scene counts in parallel lists
+	headings = []
+	dialogue_counts = []
+	action_counts = []
+	character_lines = Counter()
 	total_dialogue_lines = 0
 
 	for scene in scenes:
-		dialogue_count = 0
+		speakers = []  # Speaker of each dialogue line in this scene
 		action_count = 0
 		current_character = None
 
-		for line in scene["content"]:
-			if is_character_name(line):
+		for line_type, line in scene["content"]:
+			if line_type == CHAR:
 				current_character = line.strip().upper()
-			elif is_dialogue(line):
-				dialogue_count += 1
-				total_dialogue_lines += 1
-				if current_character:
-					character_lines[current_character] += 1
-				else:
-					character_lines["UNKNOWN"] += 1
-			elif is_action(line):
+			elif line_type in DIALOGUE_TYPES:
+				speakers.append(current_character or "UNKNOWN")
+			elif line_type in ACTION_TYPES:
 				action_count += 1
 
+		# Fold the scene's speakers into the script-wide counts in one update
+		character_lines.update(speakers)
+		dialogue_count = len(speakers)
+		total_dialogue_lines += dialogue_count
+
+		headings.append(scene["heading"])
+		dialogue_counts.append(dialogue_count)
+		action_counts.append(action_count)
+
+	# Pacing is uneven when consecutive scenes differ by 4 or more lines
+	quantities = [d + a for d, a in zip(dialogue_counts, action_counts)]
+	ill_paced = any(abs(cur - prev) >= 4 for prev, cur in zip(quantities, quantities[1:]))
+
+	# Build output report
+	buf = io.StringIO()
+	w = buf.write
+	w("\nScene Pacing Report\n--------------------\n")
+	if scene_counter == 0:
+ 		w("No scenes detected\n")
+	elif scene_counter == 1:
+		w("Only one scene detected\n")
+	for index, (heading, dialogue_count, action_count) in enumerate(zip(headings, dialogue_counts, action_counts), 1):
 		# Scene pacing type
 		if dialogue_count > action_count * 2:
 			balance = "💬 Dialogue-heavy"
@@ -67,49 +80,22 @@ def scene_pacing_and_distribution(script):
 		else:
 			balance = "⚖️ Balanced"
 
-		scene_reports.append({
-			"index": scene["index"],
-			"heading": scene["heading"],
-			"dialogue": dialogue_count,
-			"action": action_count,
-			"balance": balance,
-			"quantity": dialogue_count + action_count
-		})
-
-	# Build output report
-	report = ["\nScene Pacing Report", "--------------------"]
-	ill_paced = False
-	if scene_counter == 0:
- 		report.append("No scenes detected")
-	elif scene_counter == 1:
-		report.append("Only one scene detected")
-		for i,s in enumerate(scene_reports):
-			report.append(f"Scene {s['index']}: {s['heading']}")
-			report.append(f"    - Dialogue: {s['dialogue']} lines")
-			report.append(f"    - Action: {s['action']} lines")
-			report.append(f"    - Balance: {s['balance']}\n")
-	else:
-		for i,s in enumerate(scene_reports):
-			report.append(f"Scene {s['index']}: {s['heading']}")
-			report.append(f"    - Dialogue: {s['dialogue']} lines")
-			report.append(f"    - Action: {s['action']} lines")
-			report.append(f"    - Balance: {s['balance']}\n")
-			if i > 0 :
-				p = scene_reports[i-1]
-				if abs(s['quantity'] - p['quantity']) >= 4:
-					ill_paced = True
+		w(f"Scene {index}: {heading}\n")
+		w(f"    - Dialogue: {dialogue_count} lines\n")
+		w(f"    - Action: {action_count} lines\n")
+		w(f"    - Balance: {balance}\n\n")
 	if ill_paced and scene_counter > 1:
-		report.append("Significant variation in scene lengths - Consider breaking up longer scenes")
+		w("Significant variation in scene lengths - Consider breaking up longer scenes\n")
 	else:
-		report.append("Scene length distribution is balanced")
-	report.append("Dialogue Distribution:")
-	report.append("----------------------")
+		w("Scene length distribution is balanced\n")
+	w("Dialogue Distribution:\n")
+	w("----------------------\n")
 	if total_dialogue_lines == 0:
-		report.append("    No dialogue found in the script.")
+		w("    No dialogue found in the script.\n")
 	else:
-		for char, count in character_lines.items():
+		for char, count in character_lines.most_common():  # Most lines first
 			percent = (count / total_dialogue_lines) * 100
 			bar = "█" * int(percent // 5)
-			report.append(f"    {char:<12}: {bar} {round(percent)}%")
+			w(f"    {char:<12}: {bar} {round(percent)}%\n")
 
-	return '\n'.join(report)
+	return buf.getvalue()[:-1]  # no newline after the last report line
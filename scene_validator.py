@@ -1,5 +1,6 @@
-import re
-from collections import defaultdict
+import io
+from collections import Counter, defaultdict
+from screenplay_patterns import SCENE_PREFIXES
 """
 Scene Validator Module
 
@@ -11,58 +12,91 @@ Provides:
 These utilities form the foundation for higher-level screenplay analysis modules.
 """
 
+# Line type codes produced by _classify and classify_script
+BLANK = 0
+SCENE = 1
+CHAR = 2
+DIAL = 3
+ACT = 4
+EMO = 5
+TRANS = 6
+ACT_DIAL = 7  # reads as both action and dialogue; each analyzer applies its own precedence
+
+DIALOGUE_TYPES = (DIAL, ACT_DIAL)
+ACTION_TYPES = (ACT, ACT_DIAL)
+
 # Determine if the line is a scene heading (e.g., INT./EXT.)
 def is_scene_heading(line):
-    return line.strip().upper().startswith(('INT.', 'EXT.'))
+    line = line.lstrip()
+    if not line or line[0] not in 'IEieı':  # cheap reject before upper-casing ('ı'.upper() == 'I')
+        return False
+    return line[:4].upper() in SCENE_PREFIXES
 
 # Determine if the line is a transition cue (e.g., CUT TO:, FADE OUT:)
 def is_transition(line):
-    return line.strip().upper().endswith(('TO:', 'OUT:', 'IN:'))
+    line = line.rstrip()
+    if not line or line[-1] != ':':
+        return False
+    return line[-4:].upper().endswith(('TO:', 'OUT:', 'IN:'))
 
 # Determine if the line is a parenthetical/emotion cue (e.g., (angrily))
 def is_emotion(line):
-    return line.strip().startswith('(') and line.strip().endswith(')')
+    line = line.strip()
+    return line[:1] == '(' and line[-1:] == ')'
+
+# Classify an already stripped line: scene heading, transition and emotion cues
+# win over character names, anything else is action and/or dialogue.
+# First/last character checks reject most lines before anything is upper-cased.
+# Public so text_to_script can classify lines it has already stripped.
+def classify_stripped(s):
+    if not s:
+        return BLANK
+    first, last = s[0], s[-1]
+    if first in 'IEieı' and s[:4].upper() in SCENE_PREFIXES:
+        return SCENE
+    if last == ':' and s[-4:].upper().endswith(('TO:', 'OUT:', 'IN:')):
+        return TRANS
+    if first == '(' and last == ')':
+        return EMO
+    # split(None, 4) stops after the fifth word: enough for both word-count limits
+    # Length first: it is O(1), while isupper() scans the whole line
+    if len(s) <= 40 and s.isupper() and len(s.split(None, 4)) <= 4:
+        return CHAR
+    if last in '?!':  # likely dialogue if ends with these
+        return DIAL
+    if last == '.' or len(s.split(None, 4)) > 3:
+        return ACT_DIAL
+    return ACT
+
+# Classify a raw line, stripping it exactly once
+def _classify(line):
+    return classify_stripped(line.strip())
 
 # Determine if the line is a character name (ALL CAPS and not too long)
 def is_character_name(line):
-    line = line.strip()
-    return (
-        line.isupper()
-        and len(line) <= 40
-        and 1 <= len(line.split()) <= 4
-        and not is_scene_heading(line)
-        and not is_transition(line)
-        and not is_emotion(line)
-    )
-
+    return classify_stripped(line.strip()) == CHAR  # length and caps are checked there
 
 # Determine if the line is an action line (not matching anything else)
 def is_action(line):
-    line = line.strip()
-    return (
-        line and
-        not is_scene_heading(line) and
-        not is_transition(line) and
-        not is_character_name(line) and
-        not is_emotion(line) and
-        not line.endswith(("?", "!")) # likely dialogue if ends with these
-    )
+    return _classify(line) in ACTION_TYPES
 
 # Determine if the line looks like dialogue (used for error tracking)
 def is_dialogue(line):
-    line = line.strip()
-    return (
-        line and
-        not is_scene_heading(line) and
-        not is_transition(line) and
-        not is_character_name(line) and
-        not is_emotion(line) and
-        (line.endswith(('.', '?', '!')) or len(line.split()) > 3)
-    )
+    return _classify(line) in DIALOGUE_TYPES
+
+# Classify every line of the script in a single pass so the analyzers can share it.
+# Returns (tokens, scene_starts): tokens is a list of (line_type, line) pairs holding
+# the original line text, scene_starts the token index of every scene heading.
+def classify_script(script):
+    classify = classify_stripped  # Resolved once rather than per line
+    tokens = [(classify(line.strip()), line) for line in script.strip().splitlines()]
+    scene_starts = [i for i, (line_type, _) in enumerate(tokens) if line_type == SCENE]
+    return tokens, scene_starts
 
 # Main function to validate scene structure and character use
-def scene_structure_validator(script):
-    lines = script.strip().split('\n')
+def scene_structure_validator(script, classified=None):
+    tokens, _ = classified if classified is not None else classify_script(script)
+    types = [line_type for line_type, _ in tokens]  # Neighbour checks compare codes, not text
     scene_count = 0
     valid_headings = []
     header_issues = []
@@ -70,100 +104,112 @@ def scene_structure_validator(script):
     character_lines = defaultdict(int)
     action_present = False
 
-    for i, line in enumerate(lines):
-        line = line.strip()
-        if not line:
+    for i, (line_type, line) in enumerate(tokens):
+        if line_type == BLANK:
             continue
 
         # Check for scene heading
-        if is_scene_heading(line):
+        if line_type == SCENE:
             scene_count += 1
-            valid_headings.append(f"    - {line} ✔")
+            valid_headings.append(f"    - {line.strip()} ✔")
             continue
 
         # Check for transition not followed by a heading
-        if is_transition(line):
-            if i + 1 >= len(lines) or not is_scene_heading(lines[i + 1]):
+        if line_type == TRANS:
+            if i + 1 >= len(types) or types[i + 1] != SCENE:
                 header_issues.append(f"⚠️ Line {i+1}: transition not followed by a scene heading")
             continue
 
         # Track action presence
-        if is_action(line):
+        if line_type in ACTION_TYPES:
             action_present = True
             continue
 
         # Check for dialogue contextually
-        if is_dialogue(line):
-            if i >= 1 and is_character_name(lines[i - 1]):
-                character = lines[i - 1].strip().upper()
+        if line_type == DIAL:
+            if i >= 1 and types[i - 1] == CHAR:
+                character = tokens[i - 1][1].strip().upper()
                 character_lines[character] += 1
-            elif i >= 2 and is_emotion(lines[i - 1]) and is_character_name(lines[i - 2]):
-                character = lines[i - 2].strip().upper()
+            elif i >= 2 and types[i - 1] == EMO and types[i - 2] == CHAR:
+                character = tokens[i - 2][1].strip().upper()
                 character_lines[character] += 1
             else:
                 character_lines["UNKNOWN"] += 1
                 scene_issues.append(f"❌ Line {i+1}: dialogue not preceded by character name")
 
     # Compile the report output
-    report = ["\nScene Structure Report:", "--------------------------------"]
-    report.append(f"Total Scenes: {scene_count}\n")
+    buf = io.StringIO()
+    w = buf.write
+    w("\nScene Structure Report:\n--------------------------------\n")
+    w(f"Total Scenes: {scene_count}\n\n")
     if valid_headings:
-        report.append("Valid Headings:")
-        report.extend(valid_headings)
+        w("Valid Headings:\n")
+        for heading in valid_headings:
+            w(f"{heading}\n")
     else:
-        report.append("❌ No valid scene headings found.")
+        w("❌ No valid scene headings found.\n")
 
-    report.append("\nHeader Reports:")
+    w("\nHeader Reports:\n")
     if header_issues:
-        report.extend([f"    - {issue}" for issue in header_issues])
+        for issue in header_issues:
+            w(f"    - {issue}\n")
     else:
-        report.append("    - ✔ No header errors")
+        w("    - ✔ No header errors\n")
 
-    report.append("\nScene Reports:")
+    w("\nScene Reports:\n")
     if scene_issues:
-        report.extend([f"    - {issue}" for issue in scene_issues])
+        for issue in scene_issues:
+            w(f"    - {issue}\n")
     else:
-        report.append("    - ✔ No scene structure issues")
+        w("    - ✔ No scene structure issues\n")
 
     if not action_present:
-        report.append("    - ⚠️ Script has no action lines")
+        w("    - ⚠️ Script has no action lines\n")
 
-    return '\n'.join(report)
+    return buf.getvalue()[:-1]  # no newline after the last report line
 
-# Tracks character dialogue lines and visualizes distribution
-def character_tracking(script):
-    lines = script.strip().split('\n')
+# Counts dialogue lines per character; a character cue applies until the next blank line
+def tally_character_lines(tokens):
     current_character = None
-    character_lines = defaultdict(int)
+    character_lines = Counter()
 
-    for i, line in enumerate(lines):
-        line = line.strip()
-        if is_character_name(line):
-            current_character = line
-        elif is_dialogue(line):
+    for line_type, line in tokens:
+        if line_type == CHAR:
+            current_character = line.strip()
+        elif line_type in DIALOGUE_TYPES:
             if current_character:
                 character_lines[current_character] += 1
             else:
                 character_lines["UNKNOWN"] += 1
-        elif line == '':
+        elif line_type == BLANK:
             current_character = None
+    return character_lines
+
+# Tracks character dialogue lines and visualizes distribution.
+# Callers that already hold the tally_character_lines() Counter can pass it to skip the scan.
+def character_tracking(script, classified=None, character_lines=None):
+    if character_lines is None:
+        tokens, _ = classified if classified is not None else classify_script(script)
+        character_lines = tally_character_lines(tokens)
 
     # Compile the character dialogue report
-    analysis = ["\nCharacters Found:"]
+    buf = io.StringIO()
+    w = buf.write
+    w("\nCharacters Found:\n")
     for character, count in character_lines.items():
-        analysis.append(f"    - {character}: {count} lines")
+        w(f"    - {character}: {count} lines\n")
 
-    analysis.append("\nCharacter Dialogue Distribution:")
+    w("\nCharacter Dialogue Distribution:\n")
     total_lines = sum(character_lines.values())
-    for character, count in character_lines.items():
+    for character, count in character_lines.most_common():  # Most lines first
         percent = (count / total_lines) * 100 if total_lines else 0
         bar = "█" * int(percent // 5)
-        analysis.append(f"{character:<12}: {bar} {round(percent)}%")
+        w(f"{character:<12}: {bar} {round(percent)}%\n")
 
-    analysis.append("\nCharacter Report:")
+    w("\nCharacter Report:\n")
     if "UNKNOWN" in character_lines:
-        analysis.append("    - ⚠️ Some dialogue has no character assigned")
+        w("    - ⚠️ Some dialogue has no character assigned\n")
     else:
-        analysis.append("    - ✔ No character assignment issues")
+        w("    - ✔ No character assignment issues\n")
 
-    return '\n'.join(analysis)
+    return buf.getvalue()[:-1]  # no newline after the last report line
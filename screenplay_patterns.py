@@ -0,0 +1,22 @@
+import re
+
+"""
+Screenplay Patterns Module
+
+Compiled once at import and shared by the modules that recognise screenplay
+elements:
+- SCENE_RE / SCENE_PREFIXES: scene headings (INT./EXT.)
+- TRANSITION_RE / TRANSITION_PREFIXES: transitions (CUT TO:, FADE IN:/OUT:, DISSOLVE TO:)
+- DIALOGUE_RE: one-line dialogue ("NAME (paren): dialogue")
+
+The prefix tuples are the plain-text form of the first two patterns, for
+callers that test an upper-cased line with startswith() instead of the regex.
+"""
+
+SCENE_RE       = re.compile(r'^\s*(INT\.|EXT\.)', re.I)
+TRANSITION_RE  = re.compile(r'^\s*(CUT TO:|FADE (IN|OUT):|DISSOLVE TO:)', re.I)
+#  groups:      1-name          2-paren (optional)    3-dialogue
+DIALOGUE_RE = re.compile(r'^\s*([\w\-\s]+?)(?:\s*\(([^)]+)\))?\s*:\s*(.+)$')
+
+SCENE_PREFIXES = ('INT.', 'EXT.')
+TRANSITION_PREFIXES = ('CUT TO:', 'FADE IN:', 'FADE OUT:', 'DISSOLVE TO:')
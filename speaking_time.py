@@ -1,43 +1,40 @@
+import io
 from collections import defaultdict
-from scene_validator import is_dialogue, is_character_name
+from scene_validator import classify_script, CHAR, DIALOGUE_TYPES
 
-def character_speaking_stats(script):
-    lines = script.strip().split('\n')  # Split script into individual lines
+def character_speaking_stats(script, classified=None):
+    tokens, _ = classified if classified is not None else classify_script(script)  # Classified script lines
     current_character = None  # Track the most recent character name
-    character_word_count = defaultdict(int)  # Store word counts per character
-    character_line_count = defaultdict(int)  # Store dialogue line counts per character
+    character_dialogue = defaultdict(list)  # Store dialogue lines per character
     total_lines = 0  # Count total number of dialogue lines
     
-    for line in lines:
-        if is_character_name(line):  # Detect and store character name
+    for line_type, line in tokens:
+        if line_type == CHAR:  # Detect and store character name
             current_character = line.strip().upper()
-        elif is_dialogue(line):  # Identify dialogue lines
+        elif line_type in DIALOGUE_TYPES:  # Identify dialogue lines
             total_lines += 1
-            words = len(line.split())
-            if current_character:  # Attribute words and lines to the known character
-                character_word_count[current_character] += words
-                character_line_count[current_character] += 1
-            else:  # Fallback if character name is missing
-                character_word_count["UNKNOWN"] += words
-                character_line_count["UNKNOWN"] += 1
+            # Attribute the line to the known character, or UNKNOWN if the name is missing
+            character_dialogue[current_character or "UNKNOWN"].append(line)
     
     # Build speaking statistics report
-    report = ["\nCharacter Speaking Time Report", "-------------------------------"]
-    report.append(f"Total dialogue lines: {total_lines} lines")
+    buf = io.StringIO()
+    w = buf.write  # Bound once, called for every report line
+    w("\nCharacter Speaking Time Report\n-------------------------------\n")
+    w(f"Total dialogue lines: {total_lines} lines\n")
 
-    for character in character_word_count:
-        words = character_word_count[character]
-        lines_spoken = character_line_count[character]
+    for character, spoken in character_dialogue.items():
+        words = len(" ".join(spoken).split())  # One split per character rather than per line
+        lines_spoken = len(spoken)
         time_sec = words / 2.5  # Estimate speaking time (150 wpm ≈ 2.5 words/sec)
         time_str = f"{int(time_sec // 60)} min {int(time_sec % 60)} sec" if time_sec >= 60 else f"{int(time_sec)} sec"
         
         # Add character-specific stats
-        report.append(f"{character}:")
-        report.append(f"    - Lines: {lines_spoken}")
-        report.append(f"    - Words: {words}")
-        report.append(f"    - Estimated Speaking Time: {time_str}\n")
+        w(f"{character}:\n")
+        w(f"    - Lines: {lines_spoken}\n")
+        w(f"    - Words: {words}\n")
+        w(f"    - Estimated Speaking Time: {time_str}\n\n")
     
-    if len(character_line_count) == 0:  # Handle case where no dialogue was found
-        report.append("No dialogue lines found")
+    if len(character_dialogue) == 0:  # Handle case where no dialogue was found
+        w("No dialogue lines found\n")
     
-    return '\n'.join(report)  # Return the formatted report as a single string
+    return buf.getvalue()[:-1]  # Return the report without a newline after the last line
@@ -0,0 +1,16 @@
+"""
+Shared assertions for the report tests.
+"""
+
+
+def assert_all_in(test, needles, hay):
+    """
+    Assert that every string in needles occurs in hay.
+
+    Each needle is found with str's own substring search, which already runs in
+    C; checking them together means one failure lists every missing line of a
+    report instead of stopping at the first.
+    """
+    missing = [needle for needle in needles if needle not in hay]
+    if missing:
+        test.fail(f"{len(missing)} of {len(needles)} expected strings missing: {missing!r}\n--- in ---\n{hay}")
@@ -2,8 +2,10 @@ import unittest
 import sys
 import os
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))  # for the shared _asserts helper
 from media_readability import readability_analysis
 from scene_validator import is_scene_heading
+from _asserts import assert_all_in
 
 class TestMediaReadability(unittest.TestCase):
     def setUp(self):
@@ -60,10 +62,7 @@ class TestMediaReadability(unittest.TestCase):
     def test_format_specific_flags(self):
         """Test that format-specific flags appear"""
         report = readability_analysis(self.tv_script)
-        self.assertIn("Format Flags", report)
-        self.assertIn("Web:", report)
-        self.assertIn("TV:", report)
-        self.assertIn("Stage:", report)
+        assert_all_in(self, ["Format Flags", "Web:", "TV:", "Stage:"], report)
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -63,5 +63,12 @@ class TestPacingAndDistribution(unittest.TestCase):
         report = scene_pacing_and_distribution(script)
         self.assertIn("Only one scene detected", report)
 
+    def test_distribution_ordered_by_lines(self):
+        """Characters with the most dialogue lines are listed first"""
+        script = "INT. HOUSE - DAY\nMARY\nHi.\n\nJOHN\nLine 1.\nLine 2."
+        report = scene_pacing_and_distribution(script)
+        distribution = report.split("Dialogue Distribution:")[1]
+        self.assertLess(distribution.find("JOHN"), distribution.find("MARY"))
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
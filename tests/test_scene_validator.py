@@ -2,10 +2,14 @@ import unittest
 import sys
 import os
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))  # for the shared _asserts helper
+
+from _asserts import assert_all_in
 
 from scene_validator import (
     is_scene_heading, is_transition, is_emotion, is_character_name,
-    is_action, is_dialogue, scene_structure_validator, character_tracking
+    is_action, is_dialogue, scene_structure_validator, character_tracking,
+    classify_script, tally_character_lines, BLANK, SCENE, CHAR, DIAL, ACT, EMO, TRANS, ACT_DIAL
 )
 
 class TestSceneValidator(unittest.TestCase):
@@ -20,6 +24,7 @@ class TestSceneValidator(unittest.TestCase):
         """Scene heading should start with INT. or EXT."""
         self.assertTrue(is_scene_heading("INT. ROOM - DAY"))
         self.assertTrue(is_scene_heading("EXT. PARK – NIGHT"))
+        self.assertTrue(is_scene_heading("ınt. house"))  # dotless i upper-cases to I
         self.assertFalse(is_scene_heading("FADE OUT:"))
 
     def test_transition(self):
@@ -54,6 +59,28 @@ class TestSceneValidator(unittest.TestCase):
         self.assertFalse(is_dialogue("CUT TO:"))
         self.assertFalse(is_dialogue(""))
 
+    def test_classify_script(self):
+        """Each line gets one type code and scene headings are indexed"""
+        script = """
+INT. ROOM – DAY
+SARAH
+(angrily)
+Where were you?
+He sits down
+He sits down and sighs.
+
+CUT TO:
+"""
+        tokens, scene_starts = classify_script(script)
+        self.assertEqual([t for t, _ in tokens], [SCENE, CHAR, EMO, DIAL, ACT, ACT_DIAL, BLANK, TRANS])
+        self.assertEqual(tokens[1], (CHAR, "SARAH"))
+        self.assertEqual(scene_starts, [0])
+
+    def test_classify_script_crlf(self):
+        """Windows line endings classify the same as Unix ones"""
+        script = "INT. ROOM – DAY\n\nSARAH\nWhere were you?\n"
+        self.assertEqual(classify_script(script.replace("\n", "\r\n")), classify_script(script))
+
     # ---------------- VALIDATION ----------------
 
     def test_scene_structure_validator(self):
@@ -78,10 +105,12 @@ It's over.
 FADE OUT:
 """
         result = scene_structure_validator(script)
-        self.assertIn("Scene Structure Report:", result)
-        self.assertIn("Total Scenes: 2", result)
-        self.assertIn("Header Reports:", result)
-        self.assertIn("✔ No scene structure issues", result)
+        assert_all_in(self, [
+            "Scene Structure Report:",
+            "Total Scenes: 2",
+            "Header Reports:",
+            "✔ No scene structure issues",
+        ], result)
 
     def test_character_tracking(self):
         """Ensures character lines and dialogue counts are reported accurately"""
@@ -98,10 +127,17 @@ SARAH
 We are now.
 """
         result = character_tracking(script)
-        self.assertIn("Characters Found:", result)
-        self.assertIn("SARAH: 2 lines", result)
-        self.assertIn("MARK: 1 lines", result)
-        self.assertIn("✔ No character assignment issues", result)
+        assert_all_in(self, [
+            "Characters Found:",
+            "SARAH: 2 lines",
+            "MARK: 1 lines",
+            "✔ No character assignment issues",
+        ], result)
+
+        tokens, _ = classify_script(script)
+        counts = tally_character_lines(tokens)
+        self.assertEqual(dict(counts), {"SARAH": 2, "MARK": 1})
+        self.assertEqual(character_tracking(script, character_lines=counts), result)
 
 
 if __name__ == '__main__':
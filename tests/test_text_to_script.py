@@ -1,8 +1,9 @@
 import unittest
+import io
 import sys
 import os
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
-from text_to_script import format_script
+from text_to_script import format_script, iter_format_script, classify_line, LineKind, DIALOGUE_RE, _split_dialogue
 
 class TestScriptFormatter(unittest.TestCase):
     """
@@ -75,5 +76,53 @@ class TestScriptFormatter(unittest.TestCase):
         self.assertTrue(any(" " * 10 in line and "(whispers)" in line for line in formatted))
         self.assertTrue(any("We don’t have a choice." in line for line in formatted))
 
+    def test_iterable_of_lines(self):
+        """An iterable of newline-terminated lines (e.g. an open file) formats like the joined text."""
+        raw = "INT. ROOM – NIGHT\n\nSarah: Are you serious?\nCUT TO:\n"
+        self.assertEqual(format_script(io.StringIO(raw)), format_script(raw))
+        # Line breaks a file iterator does not split on still separate lines
+        raw = "MARK\x0cHello there.\n\nSARAH\x1cWhere?\nBob: hi\x85CUT TO:\n"
+        self.assertEqual(format_script(io.StringIO(raw)), format_script(raw))
+
+    def test_other_line_breaks_split_lines(self):
+        """Text without a newline but with other line breaks still formats line by line."""
+        raw = "int. room – night\rCUT TO:\x0cMARK"
+        self.assertEqual(format_script(raw), format_script(raw.replace("\r", "\n").replace("\x0c", "\n")))
+        self.assertEqual(len(format_script(raw).splitlines()), 3)
+
+    def test_iter_format_script(self):
+        """Streamed pieces are newline-terminated and join up to format_script's output."""
+        raw = "INT. ROOM – NIGHT\n\nMark (whispers): Go.\nCUT TO:"
+        pieces = list(iter_format_script(raw))
+        self.assertEqual(len(pieces), 4)
+        self.assertTrue(all(piece.endswith('\n') for piece in pieces))
+        self.assertEqual(''.join(pieces), format_script(raw) + '\n')
+
+    def test_classify_line(self):
+        """Each kind of stripped line maps to the LineKind that picks its layout."""
+        cases = {
+            "": LineKind.BLANK,
+            "int. kitchen – night": LineKind.SCENE,
+            "FADE OUT:": LineKind.TRANSITION,
+            "Mark (whispers): Go.": LineKind.DIALOGUE_COLON,
+            "MARK": LineKind.CHAR,
+            "(angrily)": LineKind.EMOTION,
+            "Are you serious?": LineKind.DIALOGUE,
+            "He waits": LineKind.ACTION,
+        }
+        for line, kind in cases.items():
+            self.assertEqual(classify_line(line), kind, line)
+
+    def test_split_dialogue_matches_regex(self):
+        """The hand-written dialogue split agrees with DIALOGUE_RE, including lines it rejects."""
+        lines = [
+            "Sarah: Hi there", "Mark (whispers): go", "Bob (note: x): hi", "Mary-Jane  :  ok",
+            "José: hola", "A_B (x) : y", "NAME:", "NAME: ", ": x", "Bob (): hi", "Bob (x: hi",
+            "Bob (x) y: hi", "Dr. Who: hi", "He said: wait (now)", "Bob) : hi", "BOB: a\nb",
+        ]
+        for line in lines:
+            m = DIALOGUE_RE.match(line.strip())
+            self.assertEqual(_split_dialogue(line.strip()), m.groups() if m else None, line)
+
 if __name__ == '__main__':
     unittest.main()
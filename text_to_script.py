@@ -14,24 +14,183 @@ Key Features:
 
 The module can be used:
   1. As a command-line tool: python formatter.py <input.txt> [output.txt]
-  2. Through its API by importing the format_script function
+  2. Through its API by importing the format_script function (or
+     iter_format_script to stream the formatted lines)
 
 Input: Raw screenplay text with basic structure
 Output: Properly formatted screenplay adhering to industry standards
 """
 
-import re
 import sys
+from enum import IntEnum
+from functools import lru_cache
+from itertools import chain
 from pathlib import Path
-from scene_validator import is_action, is_dialogue, is_scene_heading, is_character_name, is_emotion
-# ---------- Regex patterns ---------- 
-SCENE_RE       = re.compile(r'^\s*(INT\.|EXT\.)', re.I)
-TRANSITION_RE  = re.compile(r'^\s*(CUT TO:|FADE (IN|OUT):|DISSOLVE TO:)', re.I)
-#  groups:      1-name          2-paren (optional)    3-dialogue
-DIALOGUE_RE = re.compile(r'^\s*([\w\-\s]+?)(?:\s*\(([^)]+)\))?\s*:\s*(.+)$')
+from typing import Iterable, Iterator, Union
+from scene_validator import classify_stripped, CHAR, DIAL, EMO, ACT_DIAL
+from screenplay_patterns import SCENE_RE, TRANSITION_RE, DIALOGUE_RE, SCENE_PREFIXES, TRANSITION_PREFIXES
+_HEAD_LEN = max(map(len, SCENE_PREFIXES + TRANSITION_PREFIXES))  # enough for the longest prefix
+# Indents built once rather than on every dialogue line
+_SPACE10 = ' ' * 10
+_SPACE5 = ' ' * 5
+_PAD60 = ' ' * 60
+
+def _split_dialogue(line):
+    """
+    Split a stripped "NAME (paren): dialogue" line without the regex engine.
+
+    Returns the same (name, paren, dialogue) groups DIALOGUE_RE.match would,
+    or None where it would not match. The name runs up to the first "(" or ":"
+    and may only hold word characters, hyphens and whitespace; an optional
+    parenthetical must close before the colon; the dialogue is whatever
+    follows the colon, which has to be non-empty and on the same line.
+    """
+    colon = line.find(':')
+    if colon < 0:
+        return None
+    open_paren = line.find('(', 0, colon)
+    end = colon if open_paren < 0 else open_paren
+    head = line[:end]
+    if not head:
+        return None
+    # [\w\-\s] inlined: \w is isalnum() or "_", and "-" and whitespace are the only
+    # other name characters. Single-word names pass the first C-level check.
+    if not head.isalnum():
+        letters = ''.join(head.replace('-', ' ').replace('_', ' ').split())
+        if letters and not letters.isalnum():
+            return None
+    paren = None
+    if open_paren >= 0:
+        close_paren = line.find(')', open_paren + 1)
+        if close_paren <= open_paren + 1:  # unclosed or empty parenthetical
+            return None
+        rest = line[close_paren + 1:].lstrip()
+        if rest[:1] != ':':
+            return None
+        paren = line[open_paren + 1:close_paren]
+        dialogue = rest[1:].lstrip()
+    else:
+        dialogue = line[colon + 1:].lstrip()
+    if not dialogue or '\n' in dialogue:
+        return None
+    return head.rstrip(), paren, dialogue
+
+class LineKind(IntEnum):
+    """How format_script lays out a line, in the order its checks are tried."""
+    BLANK = 0
+    SCENE = 1
+    TRANSITION = 2
+    DIALOGUE_COLON = 3  # "NAME (paren): dialogue" on a single line
+    CHAR = 4
+    EMOTION = 5
+    DIALOGUE = 6
+    ACTION = 7
+
+# scene_validator's code for a line that is none of the above -> its LineKind
+_VALIDATOR_KINDS = {
+    CHAR: LineKind.CHAR,
+    EMO: LineKind.EMOTION,
+    DIAL: LineKind.DIALOGUE,
+    ACT_DIAL: LineKind.DIALOGUE,
+}
+
+# First character -> the one heading check a line starting with it can pass.
+# "I"/"E" open scene headings and "C"/"F"/"D" transitions; re.I also folds the
+# dotless and dotted i onto "I". Lines starting with anything else skip both.
+_HEADING_CHECKS = dict.fromkeys('IEieıİ', (SCENE_PREFIXES, SCENE_RE, LineKind.SCENE))
+_HEADING_CHECKS.update(dict.fromkeys('CFDcfd', (TRANSITION_PREFIXES, TRANSITION_RE, LineKind.TRANSITION)))
+
+def classify_line(line: str) -> LineKind:
+    """
+    Classify a stripped line for format_script.
+
+    Scene headings and transitions are told apart by their opening words (only
+    checked for lines whose first character can start one) and one-line
+    dialogue by _split_dialogue. Everything else goes through a single
+    scene_validator classification, which answers what is_character_name,
+    is_emotion and is_dialogue would have asked one after another.
+    """
+    if not line:
+        return LineKind.BLANK
+    check = _HEADING_CHECKS.get(line[0])
+    if check is not None:
+        prefixes, pattern, kind = check
+        head = line[:_HEAD_LEN]
+        if head.isascii():
+            if head.upper().startswith(prefixes):
+                return kind
+        # re.I folds some non-ASCII letters (e.g. dotless i) that upper() treats differently
+        elif pattern.match(line):
+            return kind
+    if _split_dialogue(line) is not None:  # lines without a colon fail on the first find()
+        return LineKind.DIALOGUE_COLON
+    return _VALIDATOR_KINDS.get(classify_stripped(line), LineKind.ACTION)
+
+@lru_cache(maxsize=4096)
+def _format_line(line):
+    """
+    Lay out one stripped input line, returning its formatted line(s) each ending
+    in a newline. Cached because blank lines, transitions and recurring scene
+    headings show up over and over, within a script and across calls.
+    The line is already stripped and upper() never adds whitespace, so it is
+    not stripped again.
+    """
+    match classify_line(line):
+        case LineKind.BLANK:          # preserve blank lines
+            return '\n'
+
+        # 1) Scene headings
+        case LineKind.SCENE:
+            return f"{line.upper()}\n"
+
+        # 2) Transitions
+        case LineKind.TRANSITION:
+            upper = line.upper()
+            if len(upper) >= 60:
+                return f"{upper}\n"
+            return f"{_PAD60[len(upper):]}{upper}\n"  # right-aligned to column 60
+
+        # 3) Dialogue (with optional parenthetical)
+        case LineKind.DIALOGUE_COLON:
+            char_name, paren, dialogue = _split_dialogue(line)
+            name = f"{char_name.upper().strip().center(40)}\n"
+            if paren:
+                name += f"{_SPACE10}({paren.strip()})\n"  # parenthetical indented 10
+            return f"{name}{_SPACE5}{dialogue.strip()}\n"    # dialogue indented 5
+        case LineKind.CHAR:
+            return f"{line.upper().center(40)}\n"
+        case LineKind.EMOTION:
+            return f"{_SPACE10}{line}\n"
+        case LineKind.DIALOGUE:
+            return f"{_SPACE5}{line}\n"    # dialogue indented 5
+
+        # 4) Action
+        case _:
+            return f"{line}\n"
 
 # ---------- Core formatter ----------
-def format_script(text: str) -> str:
+def _split_lines(text):
+    """
+    Lines of text by str.splitlines() rules, whether it is one string or streamed
+    (e.g. an open file). File iteration only breaks on "\n", so each piece is
+    split again to also break on "\f", "\x85", "\u2028" and the rest.
+    """
+    if isinstance(text, str):
+        return text.splitlines()
+    return chain.from_iterable(map(str.splitlines, text))
+
+def iter_format_script(text: Union[str, Iterable[str]]) -> Iterator[str]:
+    """
+    Lazily format a screenplay, yielding the layout of one input line at a time.
+
+    Each piece ends in a newline (a dialogue line can expand to two or three
+    formatted lines), so writing them out in order - e.g.
+    ``out.writelines(iter_format_script(src))`` - never holds the whole
+    formatted script in memory. See format_script for the layout rules.
+    """
+    yield from map(_format_line, map(str.strip, _split_lines(text)))
+
+def format_script(text: Union[str, Iterable[str]]) -> str:
     """
     Convert raw screenplay text into properly formatted industry-standard screenplay layout.
     
@@ -44,7 +203,9 @@ def format_script(text: str) -> str:
     - Parentheticals properly indented and placed between character and dialogue
     
     Args:
-        text (str): Raw screenplay text to format
+        text (str | Iterable[str]): Raw screenplay text to format, or an iterable
+            of its lines (e.g. an open file) so large drafts are streamed rather
+            than read into memory first
         
     Returns:
         str: Formatted screenplay text with industry-standard layout
@@ -57,55 +218,22 @@ def format_script(text: str) -> str:
         5. Dialogue lines are indented 5 spaces
         6. Action descriptions appear as-is
     """
-    formatted: list[str] = [] 
-    for raw in text.splitlines():
-        line = raw.strip()
-
-        if not line:                      # preserve blank lines
-            formatted.append('')
-            continue
-
-        # 1) Scene headings
-        if SCENE_RE.match(line):
-            formatted.append(line.upper().strip())
-            continue
-        
-        # 2) Transitions
-        if TRANSITION_RE.match(line):
-            formatted.append(f"{line.upper():>60}")
-            continue
-
-        # 3) Dialogue (with optional parenthetical)
-        m = DIALOGUE_RE.match(line)
-        if m:
-            char_name, paren, dialogue = m.groups()
-            formatted.append(char_name.upper().strip().center(40))  # name
-            if paren:
-                formatted.append((' ' * 10) + f"({paren.strip()})")  # parenthetical indented 10
-            formatted.append((' ' * 5) + dialogue.strip())    # dialogue indented 5
-            continue
-        if is_character_name(line):
-            formatted.append(line.upper().strip().center(40))
-            continue
-        if is_emotion(line):
-            formatted.append((' ' * 10) + f"{line.strip()}")
-            continue
-        if is_dialogue(line):
-            formatted.append((' ' * 5) + line.strip())    # dialogue indented 5
-            continue
-            
-        # 4) Action
-        formatted.append(line)
-
-    return '\n'.join(formatted)
+    lines = _split_lines(text)
+    if type(lines) is list and len(lines) == 1:
+        # One line by splitlines' rules (so "\r" or "\f" still split): no generator or join
+        return _format_line(lines[0].strip())[:-1]
+    return ''.join(map(_format_line, map(str.strip, lines)))[:-1]  # no newline after the last line
 
 def line_write():
+    # Piped input (e.g. a draft redirected from a file) arrives in one read, not a prompt per line
+    if not sys.stdin.isatty():
+        return sys.stdin.read()
     raw_text = ""
     lines = []
     print("Since no .txt file provided, Enter Each line of your draft and hit enter")
     print("When youre done press q and enter to continue...\n")
+    error = ""  # always set before a ValueError is raised below
     while True:
-        error= ""
         try:
             text = input("line: ")
             if text.strip() == "q" and len(lines) <= 1:
@@ -118,7 +246,7 @@ def line_write():
                 error = "Enter a valid line" 
                 raise ValueError
             lines.append(text)
-        except:
+        except ValueError:  # KeyboardInterrupt and EOF still end the session
             print(error)
     raw_text = '\n'.join(lines)
     return raw_text